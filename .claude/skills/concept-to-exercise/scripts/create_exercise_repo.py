@@ -17,6 +17,11 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 
+# Git subcommands that never change the repository; their captured output is
+# cached until the next mutating command
+READ_ONLY_GIT_COMMANDS = {'rev-parse', 'rev-list', 'show', 'diff', 'log'}
+
+
 class ExerciseRepoBuilder:
     """Builds a git repository with before/after commits for a concept."""
     
@@ -25,6 +30,7 @@ class ExerciseRepoBuilder:
         self.repo_path = Path(output_dir) / concept_name
         self.before_commit = None
         self.after_commit = None
+        self._git_cache = {}
     
     def initialize_repo(self):
         """Create the repository directory and initialize git."""
@@ -90,12 +96,28 @@ class ExerciseRepoBuilder:
             return "No commits to compare"
         
         result = self._run_git([
-            'diff', '--stat',
+            'diff', '--numstat',
             self.before_commit,
             self.after_commit
         ], capture_output=True)
         
-        return result.stdout
+        lines = []
+        total_additions = 0
+        total_deletions = 0
+        for entry in result.stdout.splitlines():
+            additions, deletions, path = entry.split('\t', 2)
+            if additions == '-':
+                lines.append(f" {path} | binary")
+                continue
+            total_additions += int(additions)
+            total_deletions += int(deletions)
+            lines.append(f" {path} | +{additions} -{deletions}")
+        
+        lines.append(
+            f" {len(lines)} file(s) changed, "
+            f"{total_additions} insertion(s)(+), {total_deletions} deletion(s)(-)"
+        )
+        return '\n'.join(lines) + '\n'
     
     def get_exercise_info(self) -> Dict:
         """Get information needed for the diagnosis exercise."""
@@ -108,17 +130,31 @@ class ExerciseRepoBuilder:
         }
     
     def _run_git(self, args: List[str], capture_output: bool = False):
-        """Run a git command in the repository."""
+        """Run a git command in the repository.
+        
+        Captured results of read-only commands are memoized by their
+        arguments; any other command clears the cache.
+        """
         cmd = ['git'] + args
+        cacheable = capture_output and args[0] in READ_ONLY_GIT_COMMANDS
+        if cacheable:
+            key = tuple(args)
+            if key in self._git_cache:
+                return self._git_cache[key]
+        elif args[0] not in READ_ONLY_GIT_COMMANDS:
+            self._git_cache.clear()
         
         if capture_output:
-            return subprocess.run(
+            result = subprocess.run(
                 cmd,
                 cwd=self.repo_path,
                 capture_output=True,
                 text=True,
                 check=True
             )
+            if cacheable:
+                self._git_cache[key] = result
+            return result
         else:
             subprocess.run(
                 cmd,
@@ -153,20 +189,12 @@ def main():
     
     if args.info_only:
         # Just print info about existing repo
-        builder.before_commit = subprocess.run(
-            ['git', 'rev-list', '--max-parents=0', 'HEAD'],
-            cwd=builder.repo_path,
-            capture_output=True,
-            text=True,
-            check=True
+        builder.before_commit = builder._run_git(
+            ['rev-list', '--max-parents=0', 'HEAD'], capture_output=True
         ).stdout.strip()
         
-        builder.after_commit = subprocess.run(
-            ['git', 'rev-parse', 'HEAD'],
-            cwd=builder.repo_path,
-            capture_output=True,
-            text=True,
-            check=True
+        builder.after_commit = builder._run_git(
+            ['rev-parse', 'HEAD'], capture_output=True
         ).stdout.strip()
         
         info = builder.get_exercise_info()
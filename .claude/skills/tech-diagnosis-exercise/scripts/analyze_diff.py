@@ -7,16 +7,68 @@ for creating technical diagnosis exercises.
 
 Usage:
     python analyze_diff.py <before-commit> <after-commit> [--repo-path /path/to/repo]
+    python analyze_diff.py <before-commit> <after-commit> --json
+    python analyze_diff.py <before-commit> <after-commit> --stats-only
+    python analyze_diff.py <before-commit> <after-commit> --max-files 100 --max-lines 50000
+
+Diffs that change more than --max-files files or --max-lines lines (default
+50 and 20000) are reported as totals only ("summary_only"), without reading
+the patch. --stats-only always skips the patch and reports per-file line
+counts, categories and new/deleted files from --numstat and --name-status.
 """
 
+import asyncio
 import subprocess
 import argparse
 import json
 import re
+from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from collections import defaultdict
 
 
+_DIFF_GIT_B_RE = re.compile(rb'b/(.+)$')
+_SHORTSTAT_RE = re.compile(
+    r'(\d+) files? changed(?:, (\d+) insertions?\(\+\))?(?:, (\d+) deletions?\(-\))?'
+)
+
+_CONFIG_FILE_NAMES = frozenset({'config.py', 'settings.py', '.env', 'dockerfile', 'docker-compose.yml'})
+_EXT_TO_CATEGORY = {
+    '.yaml': 'config', '.yml': 'config', '.toml': 'config', '.ini': 'config', '.conf': 'config',
+    '.tf': 'infrastructure', '.tfvars': 'infrastructure',
+    '.py': 'application', '.js': 'application', '.ts': 'application', '.java': 'application',
+    '.go': 'application', '.rb': 'application', '.php': 'application', '.cs': 'application',
+    '.html': 'template', '.jinja': 'template', '.jinja2': 'template', '.jsx': 'template',
+    '.vue': 'template', '.erb': 'template',
+    '.css': 'style', '.scss': 'style', '.sass': 'style', '.less': 'style',
+    '.sql': 'database',
+    '.md': 'documentation', '.txt': 'documentation', '.rst': 'documentation',
+}
+
+# Diffs larger than this are summarized from --shortstat only, without
+# parsing the full patch
+MAX_FULL_DIFF_FILES = 50
+MAX_FULL_DIFF_LINES = 20000
+
+
+@dataclass(slots=True)
+class Hunk:
+    """A single hunk of a file diff."""
+    header: str
+    added_lines: list = field(default_factory=list)
+    removed_lines: list = field(default_factory=list)
+    context_lines: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class FileDiff:
+    """Per-file change summary and hunks."""
+    additions: int = 0
+    deletions: int = 0
+    category: str = "other"
+    changes: list = field(default_factory=list)
+
+
 def run_git_command(cmd, repo_path="."):
     """Run a git command and return the output."""
     result = subprocess.run(
@@ -29,10 +81,75 @@ def run_git_command(cmd, repo_path="."):
     return result.stdout
 
 
+async def _run_git_command_async(cmd, repo_path="."):
+    """Async counterpart of run_git_command."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=repo_path,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, output=stdout, stderr=stderr)
+    return stdout.decode('utf-8', 'replace')
+
+
+async def _gather_git_commands(cmds, repo_path):
+    # Let every command finish before surfacing a failure, so no git process
+    # is left running when the event loop closes
+    results = await asyncio.gather(
+        *(_run_git_command_async(cmd, repo_path) for cmd in cmds),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+def run_git_commands(cmds, repo_path="."):
+    """Run several independent git commands concurrently.
+    
+    Returns their outputs in the same order as `cmds`, so the fork/exec and
+    startup cost of each git process overlaps with the others.
+    """
+    return asyncio.run(_gather_git_commands(cmds, repo_path))
+
+
+def iter_git_lines(cmd, repo_path="."):
+    """Run a git command and yield its raw output line by line as it is produced.
+
+    Unlike run_git_command, the output is never held in memory all at once,
+    so arbitrarily large diffs can be processed in constant memory. Lines are
+    yielded as undecoded bytes without their line ending.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        cwd=repo_path,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        for line in proc.stdout:
+            yield line.rstrip(b'\r\n')
+    finally:
+        proc.stdout.close()
+        returncode = proc.wait()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def _commit_info_cmd(commit_hash):
+    return ["git", "show", "--no-patch", "--format=%H%n%an%n%ae%n%ad%n%s%n%b", commit_hash]
+
+
 def get_commit_info(commit_hash, repo_path="."):
     """Get commit message and metadata."""
-    cmd = ["git", "show", "--no-patch", "--format=%H%n%an%n%ae%n%ad%n%s%n%b", commit_hash]
-    output = run_git_command(cmd, repo_path)
+    return _parse_commit_info(run_git_command(_commit_info_cmd(commit_hash), repo_path))
+
+
+def _parse_commit_info(output):
     lines = output.split('\n')
     
     return {
@@ -52,103 +169,150 @@ def categorize_file_type(filepath):
     name = path.name.lower()
     
     # Configuration files
-    if name in ['config.py', 'settings.py', '.env', 'dockerfile', 'docker-compose.yml']:
-        return "config"
-    if ext in ['.yaml', '.yml', '.toml', '.ini', '.conf']:
+    if name in _CONFIG_FILE_NAMES:
         return "config"
+    category = _EXT_TO_CATEGORY.get(ext)
+    if category == "config":
+        return category
     
     # Infrastructure
-    if 'terraform' in str(path) or 'ansible' in str(path):
+    path_str = str(path)
+    if 'terraform' in path_str or 'ansible' in path_str:
         return "infrastructure"
-    if ext in ['.tf', '.tfvars']:
-        return "infrastructure"
-    
-    # Application code
-    if ext in ['.py', '.js', '.ts', '.java', '.go', '.rb', '.php', '.cs']:
-        return "application"
     
-    # Templates/Views
-    if ext in ['.html', '.jinja', '.jinja2', '.jsx', '.vue', '.erb']:
-        return "template"
-    
-    # Styles
-    if ext in ['.css', '.scss', '.sass', '.less']:
-        return "style"
+    # Infrastructure, application code, templates/views, styles and SQL are
+    # recognized by extension alone
+    if category is not None and category != "documentation":
+        return category
     
     # Database
-    if 'migration' in str(path) or 'schema' in str(path):
-        return "database"
-    if ext in ['.sql']:
+    if 'migration' in path_str or 'schema' in path_str:
         return "database"
     
     # Tests
-    if 'test' in str(path) or ext == '.test.js':
+    if 'test' in path_str:
         return "test"
     
     # Documentation
-    if ext in ['.md', '.txt', '.rst']:
-        return "documentation"
+    return category or "other"
+
+
+def _shortstat_cmd(before_commit, after_commit):
+    return ["git", "diff", "--shortstat", before_commit, after_commit]
+
+
+def _parse_shortstat(output):
+    match = _SHORTSTAT_RE.search(output)
+    if not match:
+        return {"files_changed": 0, "insertions": 0, "deletions": 0}
     
-    return "other"
+    return {
+        "files_changed": int(match.group(1)),
+        "insertions": int(match.group(2) or 0),
+        "deletions": int(match.group(3) or 0)
+    }
+
+
+def _numstat_cmd(before_commit, after_commit):
+    return ["git", "diff", "--numstat", "-z", before_commit, after_commit]
+
+
+def _parse_numstat(output):
+    """Map each path in `git diff --numstat -z` output to a FileDiff without `changes`.
+    
+    Binary files are reported with zero additions and deletions.
+    """
+    fields = output.split('\0')
+    
+    changed_files = {}
+    i = 0
+    while i < len(fields):
+        entry = fields[i]
+        i += 1
+        if not entry:
+            continue
+        additions, deletions, path = entry.split('\t', 2)
+        if not path:
+            # Renames are followed by separate old and new path fields
+            path = fields[i + 1]
+            i += 2
+        changed_files[path] = FileDiff(
+            additions=0 if additions == '-' else int(additions),
+            deletions=0 if deletions == '-' else int(deletions),
+            category=categorize_file_type(path)
+        )
+    
+    return changed_files
+
+
+def _name_status_cmd(before_commit, after_commit):
+    return ["git", "diff", "--name-status", "-z", before_commit, after_commit]
+
+
+def _parse_name_status(output):
+    fields = output.split('\0')
+    
+    statuses = {}
+    i = 0
+    while i < len(fields) - 1:
+        status = fields[i]
+        if status[:1] in ('R', 'C'):
+            # Renames and copies list the old path, then the new one
+            path = fields[i + 2]
+            i += 3
+        else:
+            path = fields[i + 1]
+            i += 2
+        statuses[path] = status[:1]
+    
+    return statuses
 
 
 def parse_diff(before_commit, after_commit, repo_path="."):
     """Parse the diff between two commits."""
     cmd = ["git", "diff", before_commit, after_commit]
-    diff_output = run_git_command(cmd, repo_path)
-    
-    # Also get list of changed files with stats
-    cmd_stat = ["git", "diff", "--stat", before_commit, after_commit]
-    stat_output = run_git_command(cmd_stat, repo_path)
     
     # Parse changed files
-    changed_files = defaultdict(lambda: {
-        "additions": 0,
-        "deletions": 0,
-        "category": "other",
-        "changes": []
-    })
+    changed_files = {}
     
     current_file = None
     current_hunk = None
     
-    for line in diff_output.split('\n'):
+    # Additions/deletions are counted from the patch itself, so no separate
+    # --stat call is needed. Lines are scanned as bytes; only the parts that
+    # are kept (file names, hunk headers, line content) are decoded.
+    for line in iter_git_lines(cmd, repo_path):
         # New file diff
-        if line.startswith('diff --git'):
+        if line.startswith(b'diff --git'):
             # Extract filename
-            match = re.search(r'b/(.+)$', line)
+            match = _DIFF_GIT_B_RE.search(line)
             if match:
-                current_file = match.group(1)
-                changed_files[current_file]["category"] = categorize_file_type(current_file)
+                current_file = match.group(1).decode('utf-8', 'replace')
+                changed_files[current_file] = FileDiff(category=categorize_file_type(current_file))
         
         # Hunk header
-        elif line.startswith('@@'):
+        elif line.startswith(b'@@'):
             if current_file:
-                current_hunk = {
-                    "header": line,
-                    "added_lines": [],
-                    "removed_lines": [],
-                    "context_lines": []
-                }
-                changed_files[current_file]["changes"].append(current_hunk)
+                current_hunk = Hunk(header=line.decode('utf-8', 'replace'))
+                changed_files[current_file].changes.append(current_hunk)
         
         # Added line
-        elif line.startswith('+') and not line.startswith('+++'):
+        elif line.startswith(b'+') and not line.startswith(b'+++'):
             if current_hunk is not None:
-                current_hunk["added_lines"].append(line[1:])
-                changed_files[current_file]["additions"] += 1
+                current_hunk.added_lines.append(line[1:].decode('utf-8', 'replace'))
+                changed_files[current_file].additions += 1
         
         # Removed line
-        elif line.startswith('-') and not line.startswith('---'):
+        elif line.startswith(b'-') and not line.startswith(b'---'):
             if current_hunk is not None:
-                current_hunk["removed_lines"].append(line[1:])
-                changed_files[current_file]["deletions"] += 1
+                current_hunk.removed_lines.append(line[1:].decode('utf-8', 'replace'))
+                changed_files[current_file].deletions += 1
         
         # Context line
-        elif current_hunk is not None and line.startswith(' '):
-            current_hunk["context_lines"].append(line[1:])
+        elif current_hunk is not None and line.startswith(b' '):
+            current_hunk.context_lines.append(line[1:].decode('utf-8', 'replace'))
     
-    return dict(changed_files)
+    return changed_files
 
 
 def identify_key_changes(changed_files):
@@ -162,20 +326,18 @@ def identify_key_changes(changed_files):
     }
     
     for filepath, data in changed_files.items():
-        category = data["category"]
+        category = data.category
         
-        # Look for import/dependency changes
-        for change in data["changes"]:
-            for line in change["added_lines"]:
-                if any(keyword in line for keyword in ["import ", "from ", "require(", "use "]):
+        # Look for import/dependency changes and function/class definitions
+        # in a single pass over the added lines
+        for change in data.changes:
+            for line in change.added_lines:
+                if "import " in line or "from " in line or "require(" in line or "use " in line:
                     insights["import_changes"].append({
                         "file": filepath,
                         "line": line.strip()
                     })
-            
-            # Look for function/class definitions
-            for line in change["added_lines"]:
-                if any(keyword in line for keyword in ["def ", "class ", "function ", "const "]):
+                if "def " in line or "class " in line or "function " in line or "const " in line:
                     insights["function_changes"].append({
                         "file": filepath,
                         "line": line.strip(),
@@ -186,24 +348,89 @@ def identify_key_changes(changed_files):
         if category == "config":
             insights["config_changes"].append({
                 "file": filepath,
-                "additions": data["additions"],
-                "deletions": data["deletions"]
+                "additions": data.additions,
+                "deletions": data.deletions
             })
     
     return insights
 
 
-def generate_analysis_summary(before_commit, after_commit, repo_path="."):
-    """Generate a complete analysis summary."""
-    before_info = get_commit_info(before_commit, repo_path)
-    after_info = get_commit_info(after_commit, repo_path)
+def generate_analysis_summary(before_commit, after_commit, repo_path=".",
+                              max_files=MAX_FULL_DIFF_FILES,
+                              max_lines=MAX_FULL_DIFF_LINES):
+    """Generate a complete analysis summary.
+    
+    The diff size is probed with --shortstat first; if it exceeds max_files
+    or max_lines, only the totals are reported ("summary_only") and the full
+    patch is never read.
+    """
+    # The commit lookups and the size probe are independent, so run them at once
+    before_out, after_out, shortstat_out = run_git_commands([
+        _commit_info_cmd(before_commit),
+        _commit_info_cmd(after_commit),
+        _shortstat_cmd(before_commit, after_commit)
+    ], repo_path)
+    before_info = _parse_commit_info(before_out)
+    after_info = _parse_commit_info(after_out)
+    shortstat = _parse_shortstat(shortstat_out)
+    
+    if (shortstat["files_changed"] > max_files
+            or shortstat["insertions"] + shortstat["deletions"] > max_lines):
+        return {
+            "summary_only": True,
+            "commits": {
+                "before": before_info,
+                "after": after_info
+            },
+            "changed_files": {},
+            "insights": identify_key_changes({}),
+            "by_category": {},
+            "stats": {
+                "total_files_changed": shortstat["files_changed"],
+                "total_additions": shortstat["insertions"],
+                "total_deletions": shortstat["deletions"]
+            }
+        }
+    
     changed_files = parse_diff(before_commit, after_commit, repo_path)
     insights = identify_key_changes(changed_files)
     
+    return _build_summary(before_info, after_info, changed_files, insights)
+
+
+def stats_only_summary(before_commit, after_commit, repo_path="."):
+    """Generate a summary from per-file stats only, without reading the patch.
+    
+    Line-level insights (imports, functions) are not available in this mode;
+    new and deleted files are reported from `git diff --name-status`.
+    """
+    before_out, after_out, numstat_out, name_status_out = run_git_commands([
+        _commit_info_cmd(before_commit),
+        _commit_info_cmd(after_commit),
+        _numstat_cmd(before_commit, after_commit),
+        _name_status_cmd(before_commit, after_commit)
+    ], repo_path)
+    before_info = _parse_commit_info(before_out)
+    after_info = _parse_commit_info(after_out)
+    changed_files = _parse_numstat(numstat_out)
+    statuses = _parse_name_status(name_status_out)
+    
+    insights = identify_key_changes(changed_files)
+    for filepath, status in statuses.items():
+        if status == 'A':
+            insights["new_files"].append(filepath)
+        elif status == 'D':
+            insights["deleted_files"].append(filepath)
+    
+    return _build_summary(before_info, after_info, changed_files, insights)
+
+
+def _build_summary(before_info, after_info, changed_files, insights):
+    """Assemble the summary dict shared by the full and stats-only analyses."""
     # Categorize changes
     by_category = defaultdict(list)
     for filepath, data in changed_files.items():
-        by_category[data["category"]].append(filepath)
+        by_category[data.category].append(filepath)
     
     summary = {
         "commits": {
@@ -215,8 +442,8 @@ def generate_analysis_summary(before_commit, after_commit, repo_path="."):
         "by_category": dict(by_category),
         "stats": {
             "total_files_changed": len(changed_files),
-            "total_additions": sum(f["additions"] for f in changed_files.values()),
-            "total_deletions": sum(f["deletions"] for f in changed_files.values())
+            "total_additions": sum(f.additions for f in changed_files.values()),
+            "total_deletions": sum(f.deletions for f in changed_files.values())
         }
     }
     
@@ -243,12 +470,18 @@ def print_readable_summary(summary):
     print(f"  Lines deleted: {summary['stats']['total_deletions']}")
     print()
     
+    if summary.get("summary_only"):
+        print("Diff too large for a full analysis; showing totals only.")
+        print("Re-run with higher --max-files/--max-lines to analyze it in full.")
+        print("=" * 80)
+        return
+    
     print("CHANGES BY CATEGORY:")
     for category, files in summary['by_category'].items():
         print(f"  {category.upper()}: {len(files)} file(s)")
         for f in files[:3]:  # Show first 3
-            additions = summary['changed_files'][f]['additions']
-            deletions = summary['changed_files'][f]['deletions']
+            additions = summary['changed_files'][f].additions
+            deletions = summary['changed_files'][f].deletions
             print(f"    - {f} (+{additions}/-{deletions})")
         if len(files) > 3:
             print(f"    ... and {len(files) - 3} more")
@@ -299,17 +532,35 @@ def main():
     parser.add_argument("after_commit", help="After commit hash")
     parser.add_argument("--repo-path", default=".", help="Path to git repository")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--max-files", type=int, default=MAX_FULL_DIFF_FILES,
+                        help="Only summarize totals when more files than this changed")
+    parser.add_argument("--max-lines", type=int, default=MAX_FULL_DIFF_LINES,
+                        help="Only summarize totals when more lines than this changed")
+    parser.add_argument("--stats-only", action="store_true",
+                        help="Report categories and line counts only, without parsing the patch")
     
     args = parser.parse_args()
     
     try:
-        summary = generate_analysis_summary(
-            args.before_commit,
-            args.after_commit,
-            args.repo_path
-        )
+        if args.stats_only:
+            summary = stats_only_summary(
+                args.before_commit,
+                args.after_commit,
+                args.repo_path
+            )
+        else:
+            summary = generate_analysis_summary(
+                args.before_commit,
+                args.after_commit,
+                args.repo_path,
+                max_files=args.max_files,
+                max_lines=args.max_lines
+            )
         
         if args.json:
+            summary["changed_files"] = {
+                path: asdict(data) for path, data in summary["changed_files"].items()
+            }
             print(json.dumps(summary, indent=2))
         else:
             print_readable_summary(summary)
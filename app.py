@@ -7,14 +7,69 @@ and get instructor reviews.
 """
 
 import re
+import threading
+import time
+from functools import lru_cache
 import markdown
 from markupsafe import Markup
-from flask import Flask, render_template
+from flask import Flask, render_template, session
 from flask_login import LoginManager, current_user
+from sqlalchemy.orm import selectinload
 from config import Config
+from middleware.auth import init_auth_urls
 from models import db
 from models.user import User
 from models.module import LearningModule
+from models.goal import LearningGoal
+
+# Translation table for escape_html (single pass over the string)
+_HTML_TRANS = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#39;',
+})
+
+# Diff header patterns used by format_diff_filter
+_DIFF_GIT_RE = re.compile(r'diff --git a/(.+) b/(.+)')
+_HUNK_RE = re.compile(r'@@ -(\d+)(?:,\d+)? \+(\d+)(?:,\d+)? @@(.*)')
+
+# Per-line HTML for format_diff_filter (line numbers, then escaped text)
+_ADDED_TMPL = (
+    '<div class="diff-line diff-added">'
+    '<span class="line-num old"></span>'
+    '<span class="line-num new">%d</span>'
+    '<span class="diff-marker">+</span>'
+    '<span class="diff-text">%s</span>'
+    '</div>'
+)
+_REMOVED_TMPL = (
+    '<div class="diff-line diff-removed">'
+    '<span class="line-num old">%d</span>'
+    '<span class="line-num new"></span>'
+    '<span class="diff-marker">-</span>'
+    '<span class="diff-text">%s</span>'
+    '</div>'
+)
+_CONTEXT_TMPL = (
+    '<div class="diff-line diff-context">'
+    '<span class="line-num old">%d</span>'
+    '<span class="line-num new">%d</span>'
+    '<span class="diff-marker"> </span>'
+    '<span class="diff-text">%s</span>'
+    '</div>'
+)
+
+# Inputs longer than this are rendered without caching. Rendered HTML runs to
+# about 5x the input for diffs and up to 10x for highlighted code in markdown,
+# so with 32 entries per cache the render caches stay under roughly 10 MB per
+# worker in the worst case
+_RENDER_CACHE_MAX_INPUT = 20_000
+
+# One Markdown converter per thread; building it loads every extension, so
+# it is created once and reset() between documents instead
+_md_local = threading.local()
 
 # Create Flask app
 app = Flask(__name__)
@@ -27,19 +82,33 @@ def markdown_filter(text):
     """Convert markdown to HTML with code highlighting."""
     if not text:
         return ''
-    # Use markdown with fenced code blocks and code highlighting
-    md = markdown.Markdown(extensions=[
-        'fenced_code',
-        'codehilite',
-        'tables',
-        'nl2br'
-    ], extension_configs={
-        'codehilite': {
-            'css_class': 'highlight',
-            'guess_lang': True,
-        }
-    })
-    return Markup(md.convert(text))
+    if len(text) > _RENDER_CACHE_MAX_INPUT:
+        return Markup(_render_markdown.__wrapped__(text))
+    return Markup(_render_markdown(text))
+
+
+@lru_cache(maxsize=32)
+def _render_markdown(text):
+    """Render markdown text to an HTML string (cached by content)."""
+    md = getattr(_md_local, 'md', None)
+    if md is None:
+        # Use markdown with fenced code blocks and code highlighting.
+        # Only fences tagged with a language are highlighted; untagged fences
+        # render as plain code blocks rather than running Pygments' guesser.
+        md = _md_local.md = markdown.Markdown(extensions=[
+            'fenced_code',
+            'codehilite',
+            'tables',
+            'nl2br'
+        ], extension_configs={
+            'codehilite': {
+                'css_class': 'highlight',
+                'guess_lang': False,
+                'use_pygments': True,
+            }
+        })
+    md.reset()
+    return md.convert(text)
 
 
 @app.template_filter('format_diff')
@@ -55,70 +124,47 @@ def format_diff_filter(diff_text):
     """
     if not diff_text:
         return ''
-
-    lines = diff_text.split('\n')
-    formatted_lines = []
+    if len(diff_text) > _RENDER_CACHE_MAX_INPUT:
+        return Markup(_render_diff.__wrapped__(diff_text))
+    return Markup(_render_diff(diff_text))
+
+
+@lru_cache(maxsize=32)
+def _render_diff(diff_text):
+    """Render a unified diff to an HTML string (cached by content)."""
+    return '\n'.join(_iter_format(diff_text.split('\n')))
+
+
+def _get_file_icon(filename):
+    """Get an appropriate icon for the file type."""
+    if filename.endswith('.py'):
+        return '<span class="file-icon" title="Python">&#128013;</span>'  # Snake emoji
+    elif filename.endswith(('.js', '.ts')):
+        return '<span class="file-icon" title="JavaScript">&#128312;</span>'  # Yellow circle
+    elif filename.endswith(('.html', '.htm')):
+        return '<span class="file-icon" title="HTML">&#128196;</span>'  # Page
+    elif filename.endswith('.css'):
+        return '<span class="file-icon" title="CSS">&#127912;</span>'  # Palette
+    else:
+        return '<span class="file-icon">&#128196;</span>'  # Default page icon
+
+
+def _iter_format(lines):
+    """Yield the HTML chunks for format_diff_filter, one file at a time."""
+    file_lines = []  # Rendered lines of the current file, held until its stats are known
     current_file = None
     old_line_num = 0
     new_line_num = 0
     file_additions = 0
     file_deletions = 0
+    is_new_file = False
+    is_deleted_file = False
     in_diff_content = False
 
     def close_current_file():
-        """Close the current file's diff-content div if open."""
+        """Yield the current file's header, its buffered lines, and the closing divs."""
         nonlocal in_diff_content
         if in_diff_content:
-            formatted_lines.append('</div></div>')  # Close diff-content and diff-file
-            in_diff_content = False
-
-    def get_file_icon(filename):
-        """Get an appropriate icon for the file type."""
-        if filename.endswith('.py'):
-            return '<span class="file-icon" title="Python">&#128013;</span>'  # Snake emoji
-        elif filename.endswith(('.js', '.ts')):
-            return '<span class="file-icon" title="JavaScript">&#128312;</span>'  # Yellow circle
-        elif filename.endswith(('.html', '.htm')):
-            return '<span class="file-icon" title="HTML">&#128196;</span>'  # Page
-        elif filename.endswith('.css'):
-            return '<span class="file-icon" title="CSS">&#127912;</span>'  # Palette
-        else:
-            return '<span class="file-icon">&#128196;</span>'  # Default page icon
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Git diff header - start of a new file
-        if line.startswith('diff --git'):
-            close_current_file()
-
-            # Extract filename from "diff --git a/file b/file"
-            match = re.match(r'diff --git a/(.+) b/(.+)', line)
-            if match:
-                current_file = match.group(2)
-            else:
-                current_file = line
-
-            # Look ahead to count stats for this file
-            file_additions = 0
-            file_deletions = 0
-            is_new_file = False
-            is_deleted_file = False
-
-            j = i + 1
-            while j < len(lines) and not lines[j].startswith('diff --git'):
-                peek_line = lines[j]
-                if peek_line.startswith('new file'):
-                    is_new_file = True
-                elif peek_line.startswith('deleted file'):
-                    is_deleted_file = True
-                elif peek_line.startswith('+') and not peek_line.startswith('+++'):
-                    file_additions += 1
-                elif peek_line.startswith('-') and not peek_line.startswith('---'):
-                    file_deletions += 1
-                j += 1
-
             # Build file header with stats
             file_status = ''
             if is_new_file:
@@ -126,34 +172,55 @@ def format_diff_filter(diff_text):
             elif is_deleted_file:
                 file_status = '<span class="file-status deleted">DELETED</span>'
 
-            icon = get_file_icon(current_file)
+            icon = _get_file_icon(current_file)
             stats_html = ''
             if file_additions > 0 or file_deletions > 0:
                 stats_html = f'<span class="file-stats"><span class="additions">+{file_additions}</span><span class="deletions">-{file_deletions}</span></span>'
 
-            formatted_lines.append(f'<div class="diff-file">')
-            formatted_lines.append(f'<div class="diff-file-header">{icon}<span class="file-name">{escape_html(current_file)}</span>{file_status}{stats_html}</div>')
-            formatted_lines.append('<div class="diff-content">')
-            in_diff_content = True
-
-        # New/deleted file mode indicator
-        elif line.startswith('new file') or line.startswith('deleted file'):
-            # Skip - already handled in lookahead
-            pass
+            yield '<div class="diff-file">'
+            yield f'<div class="diff-file-header">{icon}<span class="file-name">{escape_html(current_file)}</span>{file_status}{stats_html}</div>'
+            yield '<div class="diff-content">'
+            yield from file_lines
+            yield '</div></div>'  # Close diff-content and diff-file
+            in_diff_content = False
+        else:
+            yield from file_lines
+        file_lines.clear()
+
+    for line in lines:
+        # Dispatch on the first character so the common added/removed/context
+        # lines are matched before the rarer file and hunk headers
+        first = line[:1]
+
+        # Added line (or +++ file marker, which is skipped - the filename is in the header)
+        if first == '+':
+            if line.startswith('+++'):
+                continue
+            file_lines.append(_ADDED_TMPL % (new_line_num, escape_html(line[1:])))
+            new_line_num += 1
+            file_additions += 1
 
-        # Index line (skip)
-        elif line.startswith('index '):
-            pass
+        # Removed line (or --- file marker)
+        elif first == '-':
+            if line.startswith('---'):
+                continue
+            file_lines.append(_REMOVED_TMPL % (old_line_num, escape_html(line[1:])))
+            old_line_num += 1
+            file_deletions += 1
 
-        # File markers (--- and +++)
-        elif line.startswith('---') or line.startswith('+++'):
-            # Skip file markers - we show the filename in the header
-            pass
+        # Context line (or empty line in diff)
+        elif first == ' ' or not line:
+            if not in_diff_content:
+                continue
+            content = line[1:] if len(line) > 1 else line
+            file_lines.append(_CONTEXT_TMPL % (old_line_num, new_line_num, escape_html(content)))
+            old_line_num += 1
+            new_line_num += 1
 
         # Hunk header - parse line numbers
         elif line.startswith('@@'):
             # Parse hunk header: @@ -old_start,old_count +new_start,new_count @@
-            match = re.match(r'@@ -(\d+)(?:,\d+)? \+(\d+)(?:,\d+)? @@(.*)', line)
+            match = _HUNK_RE.match(line)
             if match:
                 old_line_num = int(match.group(1))
                 new_line_num = int(match.group(2))
@@ -163,69 +230,48 @@ def format_diff_filter(diff_text):
                 hunk_text = f'@@ -{match.group(1)} +{match.group(2)} @@'
                 if context:
                     hunk_text += f' {escape_html(context)}'
-                formatted_lines.append(f'<div class="diff-hunk">{hunk_text}</div>')
+                file_lines.append(f'<div class="diff-hunk">{hunk_text}</div>')
             else:
-                formatted_lines.append(f'<div class="diff-hunk">{escape_html(line)}</div>')
-
-        # Added line
-        elif line.startswith('+') and not line.startswith('+++'):
-            content = line[1:] if len(line) > 1 else ''
-            formatted_lines.append(
-                f'<div class="diff-line diff-added">'
-                f'<span class="line-num old"></span>'
-                f'<span class="line-num new">{new_line_num}</span>'
-                f'<span class="diff-marker">+</span>'
-                f'<span class="diff-text">{escape_html(content)}</span>'
-                f'</div>'
-            )
-            new_line_num += 1
+                file_lines.append(f'<div class="diff-hunk">{escape_html(line)}</div>')
 
-        # Removed line
-        elif line.startswith('-') and not line.startswith('---'):
-            content = line[1:] if len(line) > 1 else ''
-            formatted_lines.append(
-                f'<div class="diff-line diff-removed">'
-                f'<span class="line-num old">{old_line_num}</span>'
-                f'<span class="line-num new"></span>'
-                f'<span class="diff-marker">-</span>'
-                f'<span class="diff-text">{escape_html(content)}</span>'
-                f'</div>'
-            )
-            old_line_num += 1
+        # Git diff header - start of a new file
+        elif line.startswith('diff --git'):
+            yield from close_current_file()
 
-        # Context line (or empty line in diff)
-        elif in_diff_content and (line.startswith(' ') or line == ''):
-            content = line[1:] if line.startswith(' ') and len(line) > 1 else ('' if line == '' else line)
-            formatted_lines.append(
-                f'<div class="diff-line diff-context">'
-                f'<span class="line-num old">{old_line_num}</span>'
-                f'<span class="line-num new">{new_line_num}</span>'
-                f'<span class="diff-marker"> </span>'
-                f'<span class="diff-text">{escape_html(content)}</span>'
-                f'</div>'
-            )
-            old_line_num += 1
-            new_line_num += 1
+            # Extract filename from "diff --git a/file b/file"
+            match = _DIFF_GIT_RE.match(line)
+            if match:
+                current_file = match.group(2)
+            else:
+                current_file = line
+
+            # Stats are counted as the file's lines are rendered; the header
+            # is emitted ahead of them when the file is closed
+            file_additions = 0
+            file_deletions = 0
+            is_new_file = False
+            is_deleted_file = False
+
+            in_diff_content = True
+
+        # New/deleted file mode indicator
+        elif line.startswith('new file'):
+            is_new_file = True
+        elif line.startswith('deleted file'):
+            is_deleted_file = True
 
         # Binary file indicator
         elif line.startswith('Binary file'):
-            formatted_lines.append(f'<div class="diff-binary">{escape_html(line)}</div>')
+            file_lines.append(f'<div class="diff-binary">{escape_html(line)}</div>')
 
-        i += 1
+        # Anything else (index lines, mode changes) is skipped
 
-    close_current_file()
-
-    return Markup('\n'.join(formatted_lines))
+    yield from close_current_file()
 
 
 def escape_html(text):
     """Escape HTML special characters."""
-    return (text
-        .replace('&', '&amp;')
-        .replace('<', '&lt;')
-        .replace('>', '&gt;')
-        .replace('"', '&quot;')
-        .replace("'", '&#39;'))
+    return text.translate(_HTML_TRANS) if text else text
 
 # Initialize extensions
 db.init_app(app)
@@ -237,8 +283,8 @@ login_manager.login_message_category = 'info'
 
 @login_manager.user_loader
 def load_user(user_id):
-    """Load user by ID for Flask-Login."""
-    return User.query.get(int(user_id))
+    """Load user by ID for Flask-Login (checks the session identity map first)."""
+    return db.session.get(User, int(user_id))
 
 
 # Register blueprints
@@ -257,12 +303,30 @@ app.register_blueprint(anatomy_bp)
 app.register_blueprint(scheduling_bp)
 
 
+# Home page module list, cached as plain dicts so the rows outlive the session
+_MODULES_CACHE = {'ts': 0, 'data': None}
+
+
+def _get_modules(ttl=30):
+    """Return the ordered learning modules, reloading at most every `ttl` seconds."""
+    now = time.monotonic()
+    if _MODULES_CACHE['data'] is None or now - _MODULES_CACHE['ts'] > ttl:
+        # Load every module's goal ids in one extra query for goal_count; the
+        # goals' markdown and other columns aren't needed here
+        modules = (LearningModule.query
+                   .options(selectinload(LearningModule.goals).load_only(LearningGoal.id))
+                   .order_by(LearningModule.order)
+                   .all())
+        _MODULES_CACHE['data'] = [m.to_dict() for m in modules]
+        _MODULES_CACHE['ts'] = now
+    return _MODULES_CACHE['data']
+
+
 # Home route
 @app.route('/')
 def home():
     """Home page showing available learning modules."""
-    modules = LearningModule.query.order_by(LearningModule.order).all()
-    return render_template('home.html', modules=modules)
+    return render_template('home.html', modules=_get_modules())
 
 
 # Health check
@@ -272,16 +336,39 @@ def health():
     return {'status': 'healthy'}
 
 
+# Error page as seen by anonymous visitors, rendered once on first use
+_ERROR_PAGE_CACHE = {}
+
+
+def _render_error_page():
+    """Render the error page, reusing a prebuilt copy where it cannot differ.
+
+    The page only varies with the logged-in user and pending flash messages,
+    so anonymous requests without flashes (the bulk of stray 404 traffic) get
+    the cached copy. Debug mode always renders so template edits show up.
+    """
+    if app.debug or session.get('_flashes') or current_user.is_authenticated:
+        return render_template('base.html')
+    page = _ERROR_PAGE_CACHE.get('anonymous')
+    if page is None:
+        page = _ERROR_PAGE_CACHE['anonymous'] = render_template('base.html')
+    return page
+
+
 # Error handlers
 @app.errorhandler(404)
 def not_found(error):
-    return render_template('base.html'), 404
+    return _render_error_page(), 404
 
 
 @app.errorhandler(500)
 def internal_error(error):
     db.session.rollback()
-    return render_template('base.html'), 500
+    return _render_error_page(), 500
+
+
+# All routes are registered; resolve the auth redirect targets once
+init_auth_urls(app)
 
 
 if __name__ == '__main__':
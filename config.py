@@ -3,24 +3,43 @@
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
+# Parse .env at most once per process tree: child processes (e.g. the debug
+# reloader) inherit the variables, and deployments that inject the environment
+# directly can set SKIP_DOTENV=1 to skip the file entirely
+if os.getenv('SKIP_DOTENV') != '1' and not os.getenv('DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['DOTENV_LOADED'] = '1'
+
+# Snapshot of the environment that Config resolves its settings from
+_ENV = dict(os.environ)
 
 
 class Config:
     """Application configuration."""
 
-    SECRET_KEY = os.getenv('FLASK_SECRET_KEY', 'dev-secret-key-change-in-production')
-    SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///code_dojo.db')
+    SECRET_KEY = _ENV.get('FLASK_SECRET_KEY', 'dev-secret-key-change-in-production')
+    SQLALCHEMY_DATABASE_URI = _ENV.get('DATABASE_URL', 'sqlite:///code_dojo.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
-    ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY', '')
+
+    # Connection pool for client/server databases: keep connections open
+    # across requests, check them before use and recycle them ahead of
+    # server-side idle timeouts. SQLite keeps SQLAlchemy's defaults.
+    SQLALCHEMY_ENGINE_OPTIONS = {} if SQLALCHEMY_DATABASE_URI.startswith('sqlite') else {
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_timeout': 30,
+        'pool_pre_ping': True,
+        'pool_recycle': 1800,
+    }
+    ANTHROPIC_API_KEY = _ENV.get('ANTHROPIC_API_KEY', '')
 
     # GitHub API
     # With token: 5000 req/hr, without: 60 req/hr
     GITHUB_API_BASE = 'https://api.github.com'
-    GITHUB_TOKEN = os.getenv('GITHUB_TOKEN', None)
+    GITHUB_TOKEN = _ENV.get('GITHUB_TOKEN', None)
 
     # Debug mode
-    DEBUG = os.getenv('FLASK_DEBUG', '1') == '1'
+    DEBUG = _ENV.get('FLASK_DEBUG', '1') == '1'
 
     # Calendly scheduling
-    CALENDLY_URL = os.getenv('CALENDLY_URL', '')  # e.g., https://calendly.com/instructor-name/30min
+    CALENDLY_URL = _ENV.get('CALENDLY_URL', '')  # e.g., https://calendly.com/instructor-name/30min
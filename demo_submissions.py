@@ -8,50 +8,9 @@ This script demonstrates:
 4. Instructor reviewing both submissions
 """
 
-from app import app, db
-from models.user import User
-from models.goal import LearningGoal
-from models.submission import Submission
-from models.ai_feedback import AIFeedback
-from models.instructor_feedback import InstructorFeedback
 
-
-def create_demo_submissions():
-    """Create sample submissions for demonstration."""
-    print("Creating demo submissions...")
-
-    # Get users and goal
-    alice = User.query.filter_by(email="alice@example.com").first()
-    bob = User.query.filter_by(email="bob@example.com").first()
-    instructor = User.query.filter_by(email="instructor@codedojo.com").first()
-    goal = LearningGoal.query.first()
-
-    if not all([alice, bob, instructor, goal]):
-        print("Error: Required users or goal not found. Run seed_data.py first.")
-        return
-
-    # Clear existing submissions
-    Submission.query.delete()
-    AIFeedback.query.delete()
-    InstructorFeedback.query.delete()
-    db.session.commit()
-
-    # Alice's submission - API Key Authentication
-    print("\n1. Creating Alice's submission (API Key solution)...")
-    alice_submission = Submission(
-        user_id=alice.id,
-        goal_id=goal.id,
-        repo_url="https://github.com/nsuberi/snippet-manager-starter",
-        branch="with-api-auth",
-        status="ai_complete"
-    )
-    db.session.add(alice_submission)
-    db.session.flush()
-
-    # AI Feedback for Alice
-    alice_ai_feedback = AIFeedback(
-        submission_id=alice_submission.id,
-        content="""## AI Feedback for API Key Authentication Solution
+# AI feedback on Alice's API Key solution
+_ALICE_AI = """## AI Feedback for API Key Authentication Solution
 
 ### Correctness (Excellent)
 
@@ -87,25 +46,9 @@ Great work! Your API key implementation is solid and follows best practices. The
 
 **Recommendation:** Ready for instructor review!
 """
-    )
-    db.session.add(alice_ai_feedback)
-
-    # Bob's submission - Basic Auth
-    print("2. Creating Bob's submission (Basic Auth solution)...")
-    bob_submission = Submission(
-        user_id=bob.id,
-        goal_id=goal.id,
-        repo_url="https://github.com/nsuberi/snippet-manager-starter",
-        branch="with-basic-auth",
-        status="reviewed"
-    )
-    db.session.add(bob_submission)
-    db.session.flush()
 
-    # AI Feedback for Bob
-    bob_ai_feedback = AIFeedback(
-        submission_id=bob_submission.id,
-        content="""## AI Feedback for HTTP Basic Authentication Solution
+# AI feedback on Bob's HTTP Basic Auth solution
+_BOB_AI = """## AI Feedback for HTTP Basic Authentication Solution
 
 ### Correctness (Excellent)
 
@@ -145,14 +88,9 @@ Excellent implementation! Your HTTP Basic Auth solution demonstrates strong unde
 
 **Recommendation:** This is production-ready code. Excellent work!
 """
-    )
-    db.session.add(bob_ai_feedback)
 
-    # Instructor feedback for Bob (marking as reviewed and passed)
-    bob_instructor_feedback = InstructorFeedback(
-        submission_id=bob_submission.id,
-        instructor_id=instructor.id,
-        comment="""Great work, Bob!
+# Instructor review of Bob's solution
+_BOB_INSTRUCTOR = """Great work, Bob!
 
 Your HTTP Basic Authentication implementation shows strong understanding of:
 - Security best practices (password hashing, never storing plaintext)
@@ -166,7 +104,85 @@ A few things I particularly liked:
 
 One suggestion for your learning: Try implementing both API Key and Basic Auth solutions and compare them. Understanding when to use each is valuable.
 
-Keep up the excellent work!""",
+Keep up the excellent work!"""
+
+
+def create_demo_submissions():
+    """Create sample submissions for demonstration."""
+    # Imported here so that importing this module doesn't build the Flask app
+    from models import db
+    from models.user import User
+    from models.goal import LearningGoal
+    from models.submission import Submission
+    from models.ai_feedback import AIFeedback
+    from models.instructor_feedback import InstructorFeedback
+
+    print("Creating demo submissions...")
+
+    # Get users and goal
+    users = {
+        user.email: user
+        for user in User.query.filter(User.email.in_([
+            "alice@example.com", "bob@example.com", "instructor@codedojo.com"
+        ])).all()
+    }
+    alice = users.get("alice@example.com")
+    bob = users.get("bob@example.com")
+    instructor = users.get("instructor@codedojo.com")
+    goal = LearningGoal.query.first()
+
+    if not all([alice, bob, instructor, goal]):
+        print("Error: Required users or goal not found. Run seed_data.py first.")
+        return
+
+    # Clear existing submissions (feedback first, as it references them).
+    # Everything below happens in one transaction, committed at the end.
+    db.session.execute(db.delete(AIFeedback))
+    db.session.execute(db.delete(InstructorFeedback))
+    db.session.execute(db.delete(Submission))
+
+    # Alice's submission - API Key Authentication
+    print("\n1. Creating Alice's submission (API Key solution)...")
+    alice_submission = Submission(
+        user_id=alice.id,
+        goal_id=goal.id,
+        repo_url="https://github.com/nsuberi/snippet-manager-starter",
+        branch="with-api-auth",
+        status="ai_complete"
+    )
+    db.session.add(alice_submission)
+
+    # AI Feedback for Alice (linked through the relationship, so no flush is
+    # needed to learn the submission's id)
+    alice_ai_feedback = AIFeedback(
+        submission=alice_submission,
+        content=_ALICE_AI
+    )
+    db.session.add(alice_ai_feedback)
+
+    # Bob's submission - Basic Auth
+    print("2. Creating Bob's submission (Basic Auth solution)...")
+    bob_submission = Submission(
+        user_id=bob.id,
+        goal_id=goal.id,
+        repo_url="https://github.com/nsuberi/snippet-manager-starter",
+        branch="with-basic-auth",
+        status="reviewed"
+    )
+    db.session.add(bob_submission)
+
+    # AI Feedback for Bob
+    bob_ai_feedback = AIFeedback(
+        submission=bob_submission,
+        content=_BOB_AI
+    )
+    db.session.add(bob_ai_feedback)
+
+    # Instructor feedback for Bob (marking as reviewed and passed)
+    bob_instructor_feedback = InstructorFeedback(
+        submission=bob_submission,
+        instructor_id=instructor.id,
+        comment=_BOB_INSTRUCTOR,
         passed=True
     )
     db.session.add(bob_instructor_feedback)
@@ -193,5 +209,7 @@ Keep up the excellent work!""",
 
 
 if __name__ == '__main__':
+    from app import app
+
     with app.app_context():
         create_demo_submissions()
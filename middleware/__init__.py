@@ -1,3 +1,3 @@
 """Middleware package."""
 
-from middleware.auth import require_auth, require_admin, require_instructor
+from middleware.auth import require, require_auth, require_admin, require_instructor
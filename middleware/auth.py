@@ -1,44 +1,67 @@
 """Authentication middleware decorators."""
 
 from functools import wraps
-from flask import redirect, url_for, flash
+from flask import redirect, url_for, flash, request
 from flask_login import current_user
 
+# Redirect targets, resolved once by init_auth_urls() (paths relative to the
+# application root)
+_cached_urls = {}
 
-def require_auth(f):
-    """Decorator that requires user to be authenticated."""
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        if not current_user.is_authenticated:
-            flash('Please log in to access this page.', 'warning')
-            return redirect(url_for('auth.login'))
-        return f(*args, **kwargs)
-    return decorated
-
-
-def require_admin(f):
-    """Decorator that requires user to be an admin."""
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        if not current_user.is_authenticated:
-            flash('Please log in to access this page.', 'warning')
-            return redirect(url_for('auth.login'))
-        if not current_user.is_admin:
-            flash('Admin access required.', 'danger')
-            return redirect(url_for('home'))
-        return f(*args, **kwargs)
-    return decorated
-
-
-def require_instructor(f):
-    """Decorator that requires user to be an instructor or admin."""
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        if not current_user.is_authenticated:
-            flash('Please log in to access this page.', 'warning')
-            return redirect(url_for('auth.login'))
-        if not current_user.is_instructor:
-            flash('Instructor access required.', 'danger')
-            return redirect(url_for('home'))
-        return f(*args, **kwargs)
-    return decorated
+
+def init_auth_urls(app):
+    """Resolve the login and home URLs once; call after all routes are registered."""
+    adapter = app.url_map.bind('localhost')
+    _cached_urls['login'] = adapter.build('auth.login')
+    _cached_urls['home'] = adapter.build('home')
+
+
+def _url(name, endpoint):
+    """Return the cached URL for `name`, falling back to url_for if not initialized."""
+    path = _cached_urls.get(name)
+    if path is None:
+        return url_for(endpoint)
+    return request.script_root + path
+
+
+# Per-role check: (user attribute, message flashed when it is false)
+_ROLE_CHECKS = {
+    'admin': ('is_admin', 'Admin access required.'),
+    'instructor': ('is_instructor', 'Instructor access required.'),
+}
+
+
+def require(role=None):
+    """
+    Build a decorator that requires an authenticated user.
+
+    Args:
+        role: Optional 'admin' or 'instructor'; the user must also hold it
+            (admins count as instructors).
+    """
+    check = _ROLE_CHECKS[role] if role else None
+
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            # Resolve the current_user proxy once rather than on every attribute read
+            user = current_user._get_current_object()
+            if not user.is_authenticated:
+                flash('Please log in to access this page.', 'warning')
+                return redirect(_url('login', 'auth.login'))
+            if check and not getattr(user, check[0]):
+                flash(check[1], 'danger')
+                return redirect(_url('home', 'home'))
+            return f(*args, **kwargs)
+        return decorated
+    return decorator
+
+
+# Decorator that requires user to be authenticated
+require_auth = require()
+
+# Decorator that requires user to be an admin
+require_admin = require('admin')
+
+# Decorator that requires user to be an instructor or admin
+require_instructor = require('instructor')
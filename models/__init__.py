@@ -4,6 +4,12 @@ from flask_sqlalchemy import SQLAlchemy
 
 db = SQLAlchemy()
 
+
+def isoformat_z(dt):
+    """Format a naive UTC datetime as ISO 8601 with a trailing Z (None passes through)."""
+    return dt.isoformat() + 'Z' if dt is not None else None
+
+
 from models.user import User
 from models.module import LearningModule
 from models.goal import LearningGoal
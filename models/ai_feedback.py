@@ -1,7 +1,7 @@
 """AI feedback model."""
 
 from datetime import datetime
-from models import db
+from models import db, isoformat_z
 
 
 class AIFeedback(db.Model):
@@ -20,7 +20,7 @@ class AIFeedback(db.Model):
             'id': self.id,
             'submission_id': self.submission_id,
             'content': self.content,
-            'created_at': self.created_at.isoformat() + 'Z' if self.created_at else None,
+            'created_at': isoformat_z(self.created_at),
         }
 
     def __repr__(self):
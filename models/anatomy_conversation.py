@@ -1,8 +1,24 @@
 """Anatomy conversation models for tracking Socratic dialogues."""
 
+import os
+import time
 import uuid
 from datetime import datetime
-from models import db
+from models import db, isoformat_z
+
+
+def _uuid7():
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds, so ids created later
+    sort later and inserts land at the end of the primary key index instead of
+    at random positions.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = value & ~(0xF << 76) | 0x7 << 76  # version
+    value = value & ~(0x3 << 62) | 0x2 << 62  # variant
+    return uuid.UUID(int=value)
 
 
 class AnatomyConversation(db.Model):
@@ -10,7 +26,7 @@ class AnatomyConversation(db.Model):
 
     __tablename__ = 'anatomy_conversations'
 
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(db.String(36), primary_key=True, default=lambda: str(_uuid7()))
     submission_id = db.Column(db.Integer, db.ForeignKey('submissions.id'), nullable=False)
     topic_id = db.Column(db.Integer, db.ForeignKey('anatomy_topics.id'), nullable=True)
     topic_name = db.Column(db.String(200))  # For AI-detected topics (no topic_id)
@@ -22,8 +38,8 @@ class AnatomyConversation(db.Model):
     # Relationships
     submission = db.relationship('Submission', backref=db.backref('anatomy_conversations', lazy='dynamic'))
     topic = db.relationship('AnatomyTopic')
-    messages = db.relationship('ConversationMessage', backref='conversation', lazy='dynamic', order_by='ConversationMessage.created_at')
-    realizations = db.relationship('StudentRealization', backref='conversation', lazy='dynamic', order_by='StudentRealization.detected_at')
+    messages = db.relationship('ConversationMessage', backref='conversation', order_by='ConversationMessage.created_at')
+    realizations = db.relationship('StudentRealization', backref='conversation', order_by='StudentRealization.detected_at')
 
     def to_dict(self, include_messages=False, include_realizations=False):
         """Convert to dictionary."""
@@ -34,13 +50,13 @@ class AnatomyConversation(db.Model):
             'topic_name': self.topic_name,
             'status': self.status,
             'synthesis_markdown': self.synthesis_markdown,
-            'created_at': self.created_at.isoformat() + 'Z' if self.created_at else None,
-            'ended_at': self.ended_at.isoformat() + 'Z' if self.ended_at else None,
+            'created_at': isoformat_z(self.created_at),
+            'ended_at': isoformat_z(self.ended_at),
         }
         if include_messages:
-            result['messages'] = [m.to_dict() for m in self.messages.all()]
+            result['messages'] = [m.to_dict() for m in self.messages]
         if include_realizations:
-            result['realizations'] = [r.to_dict() for r in self.realizations.all()]
+            result['realizations'] = [r.to_dict() for r in self.realizations]
         return result
 
     def __repr__(self):
@@ -51,6 +67,10 @@ class ConversationMessage(db.Model):
     """Individual messages in an anatomy conversation."""
 
     __tablename__ = 'conversation_messages'
+    __table_args__ = (
+        # Serves the conversation's messages relationship (filter + order) from the index
+        db.Index('ix_conversation_messages_conversation_created', 'conversation_id', 'created_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     conversation_id = db.Column(db.String(36), db.ForeignKey('anatomy_conversations.id'), nullable=False)
@@ -65,7 +85,7 @@ class ConversationMessage(db.Model):
             'conversation_id': self.conversation_id,
             'role': self.role,
             'content': self.content,
-            'created_at': self.created_at.isoformat() + 'Z' if self.created_at else None,
+            'created_at': isoformat_z(self.created_at),
         }
 
     def __repr__(self):
@@ -76,6 +96,10 @@ class StudentRealization(db.Model):
     """Tracked realizations from anatomy conversations."""
 
     __tablename__ = 'student_realizations'
+    __table_args__ = (
+        # Serves the conversation's realizations relationship
+        db.Index('ix_student_realizations_conversation_detected', 'conversation_id', 'detected_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     conversation_id = db.Column(db.String(36), db.ForeignKey('anatomy_conversations.id'), nullable=False)
@@ -90,7 +114,7 @@ class StudentRealization(db.Model):
             'conversation_id': self.conversation_id,
             'topic': self.topic,
             'description': self.description,
-            'detected_at': self.detected_at.isoformat() + 'Z' if self.detected_at else None,
+            'detected_at': isoformat_z(self.detected_at),
         }
 
     def __repr__(self):
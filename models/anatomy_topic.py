@@ -16,7 +16,7 @@ class AnatomyTopic(db.Model):
     order = db.Column(db.Integer, default=0)
 
     # Relationships
-    goal = db.relationship('LearningGoal', backref=db.backref('anatomy_topics', lazy='dynamic', order_by='AnatomyTopic.order'))
+    goal = db.relationship('LearningGoal', backref=db.backref('anatomy_topics', order_by='AnatomyTopic.order'))
 
     def to_dict(self):
         """Convert to dictionary."""
@@ -17,7 +17,7 @@ class LearningGoal(db.Model):
     order = db.Column(db.Integer, default=0)
 
     # Relationships
-    submissions = db.relationship('Submission', backref='goal', lazy='dynamic')
+    submissions = db.relationship('Submission', backref='goal')
 
     def to_dict(self):
         """Convert to dictionary."""
@@ -1,7 +1,7 @@
 """Instructor feedback model."""
 
 from datetime import datetime
-from models import db
+from models import db, isoformat_z
 
 
 class InstructorFeedback(db.Model):
@@ -24,7 +24,7 @@ class InstructorFeedback(db.Model):
             'instructor_id': self.instructor_id,
             'comment': self.comment,
             'passed': self.passed,
-            'created_at': self.created_at.isoformat() + 'Z' if self.created_at else None,
+            'created_at': isoformat_z(self.created_at),
         }
 
     def __repr__(self):
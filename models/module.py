@@ -14,7 +14,7 @@ class LearningModule(db.Model):
     order = db.Column(db.Integer, default=0)
 
     # Relationships
-    goals = db.relationship('LearningGoal', backref='module', lazy='dynamic', order_by='LearningGoal.order')
+    goals = db.relationship('LearningGoal', backref='module', order_by='LearningGoal.order')
 
     def to_dict(self):
         """Convert to dictionary."""
@@ -23,7 +23,7 @@ class LearningModule(db.Model):
             'title': self.title,
             'description': self.description,
             'order': self.order,
-            'goal_count': self.goals.count(),
+            'goal_count': len(self.goals),
         }
 
     def __repr__(self):
@@ -1,13 +1,17 @@
 """Submission model."""
 
 from datetime import datetime
-from models import db
+from models import db, isoformat_z
 
 
 class Submission(db.Model):
     """A student's code submission for a learning goal."""
 
     __tablename__ = 'submissions'
+    __table_args__ = (
+        # Serves the pending-review count and status-filtered listings
+        db.Index('ix_submissions_status_created', 'status', 'created_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
@@ -18,6 +22,7 @@ class Submission(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     # Relationships
+    user = db.relationship('User', back_populates='submissions')
     ai_feedback = db.relationship('AIFeedback', backref='submission', uselist=False)
     instructor_feedback = db.relationship('InstructorFeedback', backref='submission', uselist=False)
 
@@ -30,7 +35,7 @@ class Submission(db.Model):
             'repo_url': self.repo_url,
             'branch': self.branch,
             'status': self.status,
-            'created_at': self.created_at.isoformat() + 'Z' if self.created_at else None,
+            'created_at': isoformat_z(self.created_at),
             'ai_feedback': self.ai_feedback.to_dict() if self.ai_feedback else None,
             'instructor_feedback': self.instructor_feedback.to_dict() if self.instructor_feedback else None,
         }
@@ -1,15 +1,27 @@
 """User model for authentication."""
 
+import secrets
 from datetime import datetime
+from functools import lru_cache
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
-from models import db
+from models import db, isoformat_z
+
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash():
+    """Hash of a random password, computed once, to check unknown-email logins against."""
+    return generate_password_hash(secrets.token_hex(16))
 
 
 class User(UserMixin, db.Model):
     """User account for authentication and role management."""
 
     __tablename__ = 'users'
+    __table_args__ = (
+        # Serves the admin dashboard's student list (filter by role, newest first)
+        db.Index('ix_users_role_created', 'role', 'created_at'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(120), unique=True, nullable=False)
@@ -18,7 +30,7 @@ class User(UserMixin, db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     # Relationships
-    submissions = db.relationship('Submission', backref='user', lazy='dynamic')
+    submissions = db.relationship('Submission', back_populates='user')
     instructor_feedbacks = db.relationship('InstructorFeedback', backref='instructor', lazy='dynamic')
 
     def set_password(self, password):
@@ -52,7 +64,12 @@ class User(UserMixin, db.Model):
     def authenticate(email, password):
         """Authenticate a user by email and password."""
         user = User.query.filter_by(email=email).first()
-        if user and user.check_password(password):
+        if user is None:
+            # Pay the same hashing cost as a real check, so response times
+            # don't reveal which emails have accounts
+            check_password_hash(_dummy_password_hash(), password)
+            return None
+        if user.check_password(password):
             return user
         return None
 
@@ -62,7 +79,7 @@ class User(UserMixin, db.Model):
             'id': self.id,
             'email': self.email,
             'role': self.role,
-            'created_at': self.created_at.isoformat() + 'Z' if self.created_at else None,
+            'created_at': isoformat_z(self.created_at),
         }
 
     def __repr__(self):
@@ -2,6 +2,7 @@
 
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from flask_login import login_required, current_user
+from sqlalchemy.orm import joinedload, selectinload
 from models import db
 from models.user import User
 from models.submission import Submission
@@ -10,7 +11,7 @@ from models.goal import LearningGoal
 from models.anatomy_topic import AnatomyTopic
 from models.anatomy_conversation import AnatomyConversation
 from middleware.auth import require_admin, require_instructor
-from services.github import fetch_github_diff, calculate_diff_stats
+from services.github import fetch_github_diff_cached, calculate_diff_stats
 
 admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
 
@@ -20,12 +21,31 @@ admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
 def dashboard():
     """Admin dashboard showing all students and submissions."""
     students = User.query.filter(User.role == 'student').order_by(User.created_at.desc()).all()
-    submissions = Submission.query.order_by(Submission.created_at.desc()).all()
+    # Each row shows its student, goal (with a topic count) and review status,
+    # so load those up front; only the columns the dashboard shows, not the
+    # challenge markdown or topic descriptions
+    submissions = (Submission.query
+                   .options(selectinload(Submission.user).load_only(User.email),
+                            selectinload(Submission.goal)
+                            .load_only(LearningGoal.title)
+                            .selectinload(LearningGoal.anatomy_topics)
+                            .load_only(AnatomyTopic.id),
+                            selectinload(Submission.instructor_feedback))
+                   .order_by(Submission.created_at.desc())
+                   .all())
     pending_reviews = Submission.query.filter_by(status='feedback_requested').count()
 
+    # Submissions per student in one grouped query rather than a COUNT per row
+    submission_counts = dict(
+        db.session.query(Submission.user_id, db.func.count(Submission.id))
+        .group_by(Submission.user_id)
+        .all()
+    )
+
     return render_template('admin/dashboard.html',
                            students=students,
                            submissions=submissions,
+                           submission_counts=submission_counts,
                            pending_reviews=pending_reviews)
 
 
@@ -33,18 +53,12 @@ def dashboard():
 @require_instructor
 def review_submission(submission_id):
     """Instructor view for reviewing a submission."""
-    submission = Submission.query.get_or_404(submission_id)
-    goal = submission.goal
-
-    # Try to get the diff for display
-    diff_content = None
-    diff_stats = {'file_count': 0, 'total_additions': 0, 'total_deletions': 0}
-    try:
-        diff_content = fetch_github_diff(goal.starter_repo, submission.repo_url, submission.branch)
-        if diff_content:
-            diff_stats = calculate_diff_stats(diff_content)
-    except Exception:
-        pass
+    # Saving a review only touches the instructor feedback; the page also shows
+    # the AI feedback, so join whichever is needed into the same query
+    options = [joinedload(Submission.instructor_feedback)]
+    if request.method == 'GET':
+        options.append(joinedload(Submission.ai_feedback))
+    submission = Submission.query.options(*options).get_or_404(submission_id)
 
     if request.method == 'POST':
         comment = request.form.get('comment', '').strip()
@@ -71,6 +85,17 @@ def review_submission(submission_id):
         flash('Review saved successfully!', 'success')
         return redirect(url_for('admin.dashboard'))
 
+    # Try to get the diff for display (only the page needs it, not the POST)
+    goal = submission.goal
+    diff_content = None
+    diff_stats = {'file_count': 0, 'total_additions': 0, 'total_deletions': 0}
+    try:
+        diff_content = fetch_github_diff_cached(goal.starter_repo, submission.repo_url, submission.branch)
+        if diff_content:
+            diff_stats = calculate_diff_stats(diff_content)
+    except Exception:
+        pass
+
     return render_template('submissions/instructor_view.html',
                            submission=submission,
                            diff_content=diff_content,
@@ -129,8 +154,11 @@ def anatomy_topics(goal_id):
         elif action == 'reorder':
             order_data = request.form.get('order', '')
             if order_data:
-                for idx, topic_id in enumerate(order_data.split(',')):
-                    topic = AnatomyTopic.query.get(int(topic_id))
+                topic_ids = [int(topic_id) for topic_id in order_data.split(',')]
+                # Fetch all the topics at once; the flush then batches the updates
+                topics = {t.id: t for t in AnatomyTopic.query.filter(AnatomyTopic.id.in_(topic_ids))}
+                for idx, topic_id in enumerate(topic_ids):
+                    topic = topics.get(topic_id)
                     if topic:
                         topic.order = idx
                 db.session.commit()
@@ -146,7 +174,11 @@ def anatomy_topics(goal_id):
 def submission_conversations(submission_id):
     """View anatomy conversations for a submission."""
     submission = Submission.query.get_or_404(submission_id)
-    conversations = submission.anatomy_conversations.order_by(AnatomyConversation.created_at.desc()).all()
+    conversations = (submission.anatomy_conversations
+                     .options(selectinload(AnatomyConversation.messages),
+                              selectinload(AnatomyConversation.realizations))
+                     .order_by(AnatomyConversation.created_at.desc())
+                     .all())
 
     return render_template('admin/submission_conversations.html',
                            submission=submission,
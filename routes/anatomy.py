@@ -2,6 +2,7 @@
 
 from flask import Blueprint, request, jsonify
 from flask_login import login_required, current_user
+from sqlalchemy.orm import selectinload
 from models.submission import Submission
 from models.anatomy_conversation import AnatomyConversation
 from services.anatomy_analyzer import get_anatomy_menu
@@ -11,7 +12,7 @@ from services.socratic_chat import (
     end_conversation,
     get_conversation_history
 )
-from services.github import fetch_github_diff
+from services.github import fetch_github_diff_cached
 
 anatomy_bp = Blueprint('anatomy', __name__, url_prefix='/submissions')
 
@@ -33,7 +34,7 @@ def get_anatomy_elements(submission_id):
     goal = submission.goal
     diff_content = None
     try:
-        diff_content = fetch_github_diff(goal.starter_repo, submission.repo_url, submission.branch)
+        diff_content = fetch_github_diff_cached(goal.starter_repo, submission.repo_url, submission.branch)
     except Exception:
         pass
 
@@ -94,7 +95,7 @@ def chat(submission_id):
     goal = submission.goal
     diff_content = None
     try:
-        diff_content = fetch_github_diff(goal.starter_repo, submission.repo_url, submission.branch)
+        diff_content = fetch_github_diff_cached(goal.starter_repo, submission.repo_url, submission.branch)
     except Exception:
         pass
 
@@ -199,6 +200,8 @@ def list_conversations(submission_id):
 
     conversations = AnatomyConversation.query.filter_by(
         submission_id=submission_id
+    ).options(
+        selectinload(AnatomyConversation.realizations)
     ).order_by(AnatomyConversation.created_at.desc()).all()
 
     return jsonify({
@@ -2,8 +2,9 @@
 
 from flask import Blueprint, render_template, request, redirect, url_for, flash
 from flask_login import login_user, logout_user, login_required, current_user
-from models import db
+from sqlalchemy.orm import selectinload
 from models.user import User
+from models.submission import Submission
 
 auth_bp = Blueprint('auth', __name__, url_prefix='/auth')
 
@@ -83,7 +84,12 @@ def logout():
 @login_required
 def account():
     """User account page showing submission history."""
-    submissions = current_user.submissions.order_by(db.desc('created_at')).all()
+    submissions = (Submission.query
+                   .filter_by(user_id=current_user.id)
+                   .options(selectinload(Submission.goal),
+                            selectinload(Submission.instructor_feedback))
+                   .order_by(Submission.created_at.desc())
+                   .all())
     return render_template('account.html', submissions=submissions)
 
 
@@ -11,7 +11,7 @@ modules_bp = Blueprint('modules', __name__, url_prefix='/modules')
 def module_detail(module_id):
     """Display a learning module with its goals."""
     module = LearningModule.query.get_or_404(module_id)
-    goals = module.goals.order_by(LearningGoal.order).all()
+    goals = module.goals  # Ordered by LearningGoal.order via the relationship
     return render_template('modules/detail.html', module=module, goals=goals)
 
 
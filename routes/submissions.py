@@ -2,11 +2,12 @@
 
 from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify
 from flask_login import login_required, current_user
+from sqlalchemy.orm import joinedload
 from models import db
 from models.submission import Submission
 from models.goal import LearningGoal
 from models.ai_feedback import AIFeedback
-from services.github import fetch_github_diff
+from services.github import fetch_github_diff_cached
 from services.ai_feedback import generate_ai_feedback
 
 submissions_bp = Blueprint('submissions', __name__, url_prefix='/submissions')
@@ -40,7 +41,8 @@ def create_submission():
 
     # Fetch diff and generate AI feedback
     try:
-        diff_content = fetch_github_diff(goal.starter_repo, repo_url, branch)
+        # Always fetch the latest diff, and prime the cache for later views of it
+        diff_content = fetch_github_diff_cached(goal.starter_repo, repo_url, branch, refresh=True)
 
         if diff_content:
             ai_content = generate_ai_feedback(
@@ -69,7 +71,11 @@ def create_submission():
 @login_required
 def view_submission(submission_id):
     """View a submission (student view)."""
-    submission = Submission.query.get_or_404(submission_id)
+    # The page shows both kinds of feedback, so join them into the same query
+    submission = (Submission.query
+                  .options(joinedload(Submission.ai_feedback),
+                           joinedload(Submission.instructor_feedback))
+                  .get_or_404(submission_id))
 
     # Only allow owner or instructors to view
     if submission.user_id != current_user.id and not current_user.is_instructor:
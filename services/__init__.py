@@ -1,4 +1,4 @@
 """Services package."""
 
-from services.github import fetch_github_diff
+from services.github import fetch_github_diff, fetch_github_diff_cached
 from services.ai_feedback import generate_ai_feedback
@@ -2,9 +2,16 @@
 
 import difflib
 import re
+import threading
+import time
 import requests
 from flask import current_app
 
+# Recently fetched diffs, keyed by (starter_repo_url, student_repo_url, branch)
+_DIFF_CACHE = {}
+_DIFF_CACHE_MAX = 64
+_DIFF_CACHE_LOCK = threading.Lock()
+
 
 def parse_github_url(url):
     """
@@ -101,11 +108,23 @@ def fetch_github_diff(starter_repo_url, student_repo_url, branch='main'):
     Returns:
         String containing unified diff content, or error message if failed
     """
+    return _fetch_github_diff(starter_repo_url, student_repo_url, branch)[0]
+
+
+def _fetch_github_diff(starter_repo_url, student_repo_url, branch):
+    """
+    Fetch the diff like fetch_github_diff, also reporting whether it is complete.
+
+    Returns:
+        Tuple of (diff, complete). complete is False for error messages and
+        for diffs where a changed file's content could not be fetched, since
+        that file then shows up as wholly added or deleted.
+    """
     starter_owner, starter_repo = parse_github_url(starter_repo_url)
     student_owner, student_repo = parse_github_url(student_repo_url)
 
     if not all([starter_owner, starter_repo, student_owner, student_repo]):
-        return None
+        return None, False
 
     headers = get_github_headers()
 
@@ -115,9 +134,9 @@ def fetch_github_diff(starter_repo_url, student_repo_url, branch='main'):
         student_resp = requests.get(student_tree_url, headers=headers, timeout=10)
 
         if student_resp.status_code == 403:
-            return "GitHub API rate limit exceeded. Please try again later or configure a GitHub token."
+            return "GitHub API rate limit exceeded. Please try again later or configure a GitHub token.", False
         if student_resp.status_code != 200:
-            return f"Error fetching student repo: {student_resp.status_code}"
+            return f"Error fetching student repo: {student_resp.status_code}", False
 
         student_tree = student_resp.json()
 
@@ -126,9 +145,9 @@ def fetch_github_diff(starter_repo_url, student_repo_url, branch='main'):
         starter_resp = requests.get(starter_tree_url, headers=headers, timeout=10)
 
         if starter_resp.status_code == 403:
-            return "GitHub API rate limit exceeded. Please try again later or configure a GitHub token."
+            return "GitHub API rate limit exceeded. Please try again later or configure a GitHub token.", False
         if starter_resp.status_code != 200:
-            return f"Error fetching starter repo: {starter_resp.status_code}"
+            return f"Error fetching starter repo: {starter_resp.status_code}", False
 
         starter_tree = starter_resp.json()
 
@@ -156,6 +175,7 @@ def fetch_github_diff(starter_repo_url, student_repo_url, branch='main'):
                     files_to_compare.append(path)
 
         diff_parts = []
+        complete = True
 
         # Check for modified and new files
         for path in files_to_compare:
@@ -182,12 +202,18 @@ def fetch_github_diff(starter_repo_url, student_repo_url, branch='main'):
             if starter_sha:
                 starter_content = fetch_file_content(
                     starter_owner, starter_repo, 'main', path, headers
-                ) or ''
+                )
+                if starter_content is None:
+                    complete = False
+                    starter_content = ''
 
             if student_sha:
                 student_content = fetch_file_content(
                     student_owner, student_repo, branch, path, headers
-                ) or ''
+                )
+                if student_content is None:
+                    complete = False
+                    student_content = ''
 
             # Skip if both are empty
             if not starter_content and not student_content:
@@ -214,7 +240,9 @@ def fetch_github_diff(starter_repo_url, student_repo_url, branch='main'):
                 # File was deleted by student
                 starter_content = fetch_file_content(
                     starter_owner, starter_repo, 'main', path, headers
-                ) or ''
+                )
+                if starter_content is None:
+                    complete = False
 
                 if starter_content:
                     diff = generate_unified_diff(starter_content, '', path, path)
@@ -223,12 +251,47 @@ def fetch_github_diff(starter_repo_url, student_repo_url, branch='main'):
                         diff_parts.append(diff_header + diff)
 
         if diff_parts:
-            return '\n'.join(diff_parts)
+            return '\n'.join(diff_parts), complete
         else:
-            return "No changes detected in key files."
+            return "No changes detected in key files.", complete
 
     except requests.RequestException as e:
-        return f"Error fetching from GitHub: {str(e)}"
+        return f"Error fetching from GitHub: {str(e)}", False
+
+
+def fetch_github_diff_cached(starter_repo_url, student_repo_url, branch='main', ttl=300, refresh=False):
+    """
+    Fetch a diff like fetch_github_diff, reusing one fetched in the last `ttl` seconds.
+
+    Views that re-render the same submission (the review page, each anatomy
+    chat turn) share one round of GitHub requests this way. Only complete diffs
+    are cached; errors such as rate limiting, and diffs where some file could
+    not be fetched, are retried on the next call. Pass refresh=True to always
+    fetch (e.g. for a new submission); this also drops any cached copy, even
+    when the new fetch is not complete enough to cache.
+
+    The cache is keyed on the branch name, not its head commit, so a push to
+    the branch can take up to `ttl` seconds to show up outside of refreshes.
+    """
+    key = (starter_repo_url, student_repo_url, branch)
+    now = time.monotonic()
+    if not refresh:
+        entry = _DIFF_CACHE.get(key)
+        if entry is not None and now - entry[0] <= ttl:
+            return entry[1]
+
+    diff, complete = _fetch_github_diff(starter_repo_url, student_repo_url, branch)
+    if refresh or complete:
+        with _DIFF_CACHE_LOCK:
+            # A refresh drops the old copy even when the new fetch can't replace it
+            _DIFF_CACHE.pop(key, None)
+            if not complete:
+                return diff
+            if len(_DIFF_CACHE) >= _DIFF_CACHE_MAX:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _DIFF_CACHE[next(iter(_DIFF_CACHE))]
+            _DIFF_CACHE[key] = (now, diff)
+    return diff
 
 
 def calculate_diff_stats(diff_content):
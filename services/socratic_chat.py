@@ -209,7 +209,7 @@ def send_message(conversation_id, user_message, diff_content=None):
 
     # Build message history
     messages = []
-    for msg in conversation.messages.order_by(ConversationMessage.created_at).all():
+    for msg in conversation.messages:
         messages.append({
             "role": msg.role,
             "content": msg.content
@@ -291,8 +291,8 @@ def end_conversation(conversation_id):
         return True, conversation.synthesis_markdown
 
     # Get all messages and realizations
-    messages = conversation.messages.order_by(ConversationMessage.created_at).all()
-    realizations = conversation.realizations.all()
+    messages = conversation.messages
+    realizations = conversation.realizations
 
     # Build conversation transcript
     transcript = "\n".join([